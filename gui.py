@@ -32,6 +32,8 @@ class SlideToObsidianApp(tk.Frame):
     def __init__(self, master: tk.Tk, **kwargs: object) -> None:
         super().__init__(master, **kwargs)
         self.input_dir: Path | None = None
+        # File list found by the last Browse; reused by Process instead of walking the tree again
+        self._cached_files: list[Path] = []
         self.progress_queue: queue.Queue = queue.Queue()
         self.worker_thread: threading.Thread | None = None
         self._build_ui()
@@ -90,6 +92,7 @@ class SlideToObsidianApp(tk.Frame):
             self.dir_var.set(path)
             self.input_dir = Path(path)
             file_list = find_powerpoint_files(self.input_dir)
+            self._cached_files = file_list
             self.file_list.configure(state="normal")
             self.file_list.delete("1.0", tk.END)
             if file_list:
@@ -110,8 +113,7 @@ class SlideToObsidianApp(tk.Frame):
         if not ok:
             messagebox.showerror("LibreOffice required", msg)
             return
-        file_list = find_powerpoint_files(self.input_dir)
-        if not file_list:
+        if not self._cached_files:
             messagebox.showwarning("No files", "No PowerPoint files found in the selected directory.")
             return
         self.process_btn.configure(state="disabled")
@@ -135,19 +137,21 @@ class SlideToObsidianApp(tk.Frame):
                 output_base,
                 mirror_structure=True,
                 progress_callback=on_progress,
+                precomputed_files=self._cached_files,
             )
             self.progress_queue.put(("done", success_count, failed, str(output_base)))
         except Exception as e:
             self.progress_queue.put(("error", str(e)))
 
     def _drain_queue(self) -> None:
+        # Only the newest progress message per tick is applied: a burst of completions
+        # becomes one progress bar redraw instead of one per file
+        latest_progress = None
         try:
             while True:
                 msg = self.progress_queue.get_nowait()
                 if msg[0] == "progress":
-                    _, current, total = msg
-                    if total:
-                        self.progress_var.set(100.0 * current / total)
+                    latest_progress = msg
                 elif msg[0] == "done":
                     _, success_count, failed, output_base = msg
                     self.progress_var.set(100)
@@ -167,4 +171,9 @@ class SlideToObsidianApp(tk.Frame):
                     return
         except queue.Empty:
             pass
-        self.after(150, self._drain_queue)
+        if latest_progress is not None:
+            _, current, total = latest_progress
+            if total:
+                self.progress_var.set(100.0 * current / total)
+        # Poll often, but drain only once Tk is idle so redraws and input come first
+        self.after(50, lambda: self.after_idle(self._drain_queue))
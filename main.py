@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 """
 SlideToObsidian: batch-convert PPTX files into AI-optimized Markdown + PDF pairs for Obsidian.
-Uses a parallel worker pool (all CPU cores minus one), markitdown for semantic extraction,
-python-pptx for speaker notes, and LibreOffice headless for PDF export.
+Uses a two-stage parallel pipeline: LibreOffice headless PDF export on threads, then
+markitdown for semantic extraction plus the MD build on a process pool. Speaker notes are
+read from the PPTX XML with lxml (python-pptx as fallback).
 """
 
 import argparse
+import multiprocessing
 import os
 import sys
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Callable
 
@@ -18,19 +21,46 @@ from tqdm import tqdm
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from src.libreoffice import check_libreoffice_installed
-from src.worker import _init_worker, convert_one_worker
+from src.worker import (
+    _cleanup_pdf_threads,
+    _init_pdf_thread,
+    _init_worker,
+    convert_pdf_batch,
+    finish_one_worker,
+)
 
 
 # All supported PowerPoint / presentation extensions (LibreOffice can convert these to PDF)
 POWERPOINT_EXTENSIONS = {".pptx", ".ppt", ".pot", ".potx", ".pps", ".ppsx"}
+_POWERPOINT_EXT_NAMES = frozenset(ext[1:] for ext in POWERPOINT_EXTENSIONS)
+
+# Upper bound on files per LibreOffice invocation (amortizes soffice startup per batch)
+MAX_BATCH_SIZE = 8
+
+# Heavy imports loaded once in the forkserver so workers start with them in memory
+_WORKER_PRELOAD = ["markitdown", "pptx", "fitz", "src.converter", "src.worker"]
 
 
 def find_powerpoint_files(root: Path) -> list[Path]:
     """Recurse under root and collect all PowerPoint file paths (case-insensitive)."""
     out: list[Path] = []
-    for p in root.rglob("*"):
-        if p.is_file() and p.suffix.lower() in POWERPOINT_EXTENSIONS:
-            out.append(p.resolve())
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                # Same rules as Path.suffix: "pptx" and ".pptx" have no extension
+                stem, dot, ext = entry.name.rpartition(".")
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif dot and stem and ext.lower() in _POWERPOINT_EXT_NAMES and entry.is_file():
+                        out.append(Path(entry.path).resolve())
+                except OSError:
+                    continue
     return sorted(out)
 
 
@@ -39,19 +69,65 @@ def find_pptx_files(root: Path) -> list[Path]:
     return find_powerpoint_files(root)
 
 
+def _worker_mp_context() -> multiprocessing.context.BaseContext | None:
+    """
+    Start method for the worker pool: forkserver with preloaded modules where the platform
+    supports it, else None (platform default, i.e. spawn on Windows).
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(_WORKER_PRELOAD)
+    return ctx
+
+
+def make_batches(
+    tasks: list[tuple[str, str]],
+    batch_size: int,
+) -> list[tuple[list[str], str]]:
+    """
+    Group (path, output_dir) tasks into (paths, output_dir) batches of at most batch_size.
+    A batch shares one output dir and never holds two files with the same stem
+    (LibreOffice would write both to the same PDF name).
+    """
+    # The n-th file with a given stem in an output dir goes to that dir's n-th "layer";
+    # within a layer stems are unique, so only the layer's current batch needs checking
+    stem_counts: dict[tuple[str, str], int] = {}
+    current: dict[tuple[str, int], list[str]] = {}
+    batches: list[tuple[list[str], str]] = []
+    for path, out in tasks:
+        stem_key = (out, os.path.splitext(os.path.basename(path))[0].lower())
+        layer = stem_counts.get(stem_key, 0)
+        stem_counts[stem_key] = layer + 1
+        paths = current.get((out, layer))
+        if paths is None or len(paths) >= batch_size:
+            paths = current[(out, layer)] = []
+            batches.append((paths, out))
+        paths.append(path)
+    return batches
+
+
 def run_conversion(
     input_path: Path,
     output_base: Path,
     *,
     mirror_structure: bool = True,
     progress_callback: Callable[[int, int, Any], None] | None = None,
+    precomputed_files: list[Path] | None = None,
 ) -> tuple[int, list[tuple[str, str]]]:
     """
     Run batch conversion. Returns (success_count, failed_list).
     failed_list is list of (path, error_string).
     If progress_callback is given, call it as (current, total, result) for each completed file.
+    If precomputed_files is given (e.g. find_powerpoint_files(input_path) from an earlier call),
+    it is used instead of walking input_path again.
     """
-    pptx_files = find_powerpoint_files(input_path) if input_path.is_dir() else [input_path]
+    # find_powerpoint_files returns resolved paths; resolve the root the same way once
+    input_path = input_path.resolve()
+    if precomputed_files is not None:
+        pptx_files = precomputed_files
+    else:
+        pptx_files = find_powerpoint_files(input_path) if input_path.is_dir() else [input_path]
     if not pptx_files:
         return 0, []
 
@@ -61,41 +137,106 @@ def run_conversion(
 
     output_base = output_base.resolve()
     output_base.mkdir(parents=True, exist_ok=True)
-    max_workers = max(1, (os.cpu_count() or 2) - 1)
-    max_workers = min(max_workers, len(pptx_files))
+    # PDF stage mostly waits on soffice subprocesses, so it gets more threads than cores;
+    # the markitdown + MD stage is CPU-bound and gets one process per core
+    cpu_count = os.cpu_count() or 2
+    pdf_workers = 2 * cpu_count
+    md_workers = min(cpu_count, len(pptx_files))
 
+    output_str = os.fspath(output_base)
     if mirror_structure and input_path.is_dir():
-        def out_dir_for(p: Path) -> Path:
+        input_str = os.fspath(input_path)
+        input_prefix = os.path.join(input_str, "")  # with trailing separator
+
+        def out_dir_for(path_str: str) -> str:
+            parent = os.path.dirname(path_str)
+            if parent == input_str:
+                return output_str
+            # Common case: the file lies under the (resolved) input root
+            if parent.startswith(input_prefix):
+                return os.path.join(output_str, parent[len(input_prefix):])
             try:
-                rel = p.parent.relative_to(input_path)
-                return output_base / rel
+                return os.fspath(output_base / Path(parent).relative_to(input_path))
             except ValueError:
-                return output_base
-        tasks = [(str(p), str(out_dir_for(p))) for p in pptx_files]
+                return output_str
+        tasks = [(s, out_dir_for(s)) for s in map(os.fspath, pptx_files)]
     else:
-        tasks = [(str(p), str(output_base)) for p in pptx_files]
+        tasks = [(os.fspath(p), output_str) for p in pptx_files]
 
     success_count = 0
     failed: list[tuple[str, str]] = []
     total = len(tasks)
     completed = 0
 
-    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
-        futures = {executor.submit(convert_one_worker, path, out): (path, out) for path, out in tasks}
-        for fut in as_completed(futures):
-            path = futures[fut][0]
-            result = None
-            try:
-                result = fut.result()
-                if result.get("success"):
-                    success_count += 1
-                else:
-                    failed.append((result.get("path", path), result.get("error", "Unknown error")))
-            except Exception as e:
-                failed.append((path, str(e)))
-            completed += 1
-            if progress_callback:
-                progress_callback(completed, total, result)
+    # Small enough batches that every PDF thread gets work, large enough to amortize soffice startup
+    batch_size = max(1, min(MAX_BATCH_SIZE, -(-total // pdf_workers)))
+    batches = make_batches(tasks, batch_size)
+    pdf_workers = min(pdf_workers, len(batches))
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=pdf_workers,
+            thread_name_prefix="pdf",
+            initializer=_init_pdf_thread,
+            # No more UNO daemons than MD workers (one per worker, as before the split)
+            initargs=(output_str, threading.Semaphore(md_workers)),
+        ) as pdf_executor, ProcessPoolExecutor(
+            max_workers=md_workers,
+            mp_context=_worker_mp_context(),
+            initializer=_init_worker,
+        ) as md_executor:
+            # Each finished PDF batch fans out into per-file MD tasks
+            pdf_futures: dict[Future, tuple[list[str], str]] = {
+                pdf_executor.submit(convert_pdf_batch, paths, out): (paths, out)
+                for paths, out in batches
+            }
+            md_futures: dict[Future, str] = {}
+            pending: set[Future] = set(pdf_futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    if fut in pdf_futures:
+                        paths, out = pdf_futures[fut]
+                        try:
+                            pdf_paths = fut.result()
+                        except Exception:
+                            pdf_paths = [None] * len(paths)
+                        submitted = 0
+                        try:
+                            for path, pdf_path in zip(paths, pdf_paths):
+                                md_fut = md_executor.submit(finish_one_worker, path, pdf_path, out)
+                                md_futures[md_fut] = path
+                                pending.add(md_fut)
+                                submitted += 1
+                        except Exception as e:
+                            # The MD pool is broken (a worker died), so nothing more can finish:
+                            # stop the PDF batches and fail every file not handed to it yet.
+                            # Cancelled futures never come back from wait(), so settle them here.
+                            pdf_executor.shutdown(wait=False, cancel_futures=True)
+                            cancelled = {f for f in pending if f in pdf_futures and f.cancelled()}
+                            pending -= cancelled
+                            lost = paths[submitted:] + [p for f in cancelled for p in pdf_futures[f][0]]
+                            for path in lost:
+                                failed.append((path, str(e)))
+                                completed += 1
+                                if progress_callback:
+                                    progress_callback(completed, total, None)
+                        continue
+                    path = md_futures[fut]
+                    result = None
+                    try:
+                        result = fut.result()
+                        if result.get("success"):
+                            success_count += 1
+                        else:
+                            failed.append((result.get("path", path), result.get("error", "Unknown error")))
+                    except Exception as e:
+                        failed.append((path, str(e)))
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, total, result)
+    finally:
+        _cleanup_pdf_threads()
     return success_count, failed
 
 
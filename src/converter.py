@@ -3,6 +3,8 @@ Single-file conversion pipeline: PowerPoint → PDF (LibreOffice) + MD (markitdo
 Supports .pptx, .ppt, .pot, .potx, .pps, .ppsx. Uses a shared MarkItDown instance when provided.
 """
 
+import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -11,7 +13,10 @@ from markitdown import MarkItDown
 from .libreoffice import convert_pptx_to_pdf
 from .markdown_builder import build_markdown, split_markdown_by_slides
 from .pdf_metadata import get_pdf_page_count, set_pdf_metadata
-from .pptx_utils import get_slide_count, get_speaker_notes
+from .pptx_utils import load_pptx_info
+
+# PDF metadata updates (open + a small incremental append) run beside the CPU-bound markitdown parse
+_metadata_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf_metadata")
 
 
 def convert_one(
@@ -25,7 +30,6 @@ def convert_one(
     """
     pptx_path = Path(pptx_path).resolve()
     output_dir = Path(output_dir).resolve()
-    stem = pptx_path.stem
 
     if markitdown_instance is None:
         markitdown_instance = MarkItDown()
@@ -33,26 +37,48 @@ def convert_one(
     try:
         # 1) PDF via LibreOffice (works for all supported formats)
         pdf_path = convert_pptx_to_pdf(pptx_path, output_dir)
-        if pdf_path is None:
-            return {"success": False, "path": str(pptx_path), "error": "PDF conversion failed (LibreOffice)"}
-        set_pdf_metadata(pdf_path, title=stem, source=str(pptx_path))
+    except Exception as e:
+        return {"success": False, "path": str(pptx_path), "error": str(e)}
+    return finish_one(pptx_path, pdf_path, output_dir, markitdown_instance)
+
+
+def finish_one(
+    pptx_path: Path,
+    pdf_path: Path | None,
+    output_dir: Path,
+    markitdown_instance: MarkItDown,
+) -> dict[str, Any]:
+    """Post-process one converted file: PDF metadata, slide count, notes, markitdown body, MD."""
+    stem = pptx_path.stem
+    if pdf_path is None:
+        return {"success": False, "path": str(pptx_path), "error": "PDF conversion failed (LibreOffice)"}
+
+    # PDF metadata is written in the background and joined before returning
+    metadata_future = _metadata_executor.submit(
+        set_pdf_metadata, pdf_path, title=stem, source=str(pptx_path)
+    )
+    try:
+        # Read the file once; the package XML parse and markitdown both work from these bytes
+        pptx_data = pptx_path.read_bytes()
 
-        # 2) Slide count: python-pptx (only .pptx) or fallback to PDF page count
-        slide_count = get_slide_count(pptx_path)
+        # 2+3) Slide count and speaker notes from one pass over the package XML (only .pptx);
+        # slide count falls back to PDF page count
+        slide_count, speaker_notes = load_pptx_info(pptx_data)
         if slide_count <= 0:
+            metadata_future.result()  # don't read the PDF while it is being rewritten
             slide_count = get_pdf_page_count(pdf_path)
         if slide_count <= 0:
             return {"success": False, "path": str(pptx_path), "error": "No slides found or invalid file"}
 
-        # 3) Speaker notes: python-pptx only supports .pptx
-        speaker_notes = get_speaker_notes(pptx_path)
         if len(speaker_notes) < slide_count:
             speaker_notes = speaker_notes + [""] * (slide_count - len(speaker_notes))
         speaker_notes = speaker_notes[:slide_count]
 
         # 4) Semantic body via markitdown (may not support all formats; fallback to empty)
         try:
-            result = markitdown_instance.convert(str(pptx_path))
+            result = markitdown_instance.convert_stream(
+                io.BytesIO(pptx_data), file_extension=pptx_path.suffix.lower()
+            )
             full_md_body = (result.text_content or "").strip()
         except Exception:
             full_md_body = ""
@@ -69,8 +95,12 @@ def convert_one(
             title=stem,
         )
         md_path = output_dir / f"{stem}.md"
-        md_path.write_text(md_content, encoding="utf-8")
+        # Pre-encoded bytes in one write, without a TextIOWrapper per file
+        with open(md_path, "wb") as f:
+            f.write(md_content.encode("utf-8"))
 
         return {"success": True, "path": str(pptx_path), "error": None}
     except Exception as e:
         return {"success": False, "path": str(pptx_path), "error": str(e)}
+    finally:
+        metadata_future.result()
@@ -1,15 +1,63 @@
 """LibreOffice headless detection and PPTX → PDF conversion."""
 
+import atexit
+import functools
 import os
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
+# Seconds allowed per input file; batch timeouts scale with the number of files
+_TIMEOUT_PER_FILE = 120
 
+# soffice is a launcher (a shell script + oosplash on Linux, soffice.exe on Windows) and the
+# real work happens in its soffice.bin child; start it in its own process group / session
+# so _kill_soffice can take down the whole tree
+if sys.platform == "win32":
+    _NEW_PROCESS_GROUP: dict[str, Any] = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _NEW_PROCESS_GROUP = {"start_new_session": True}
+
+
+@dataclass(eq=False)
+class _UnoDaemon:
+    """A persistent soffice listening on a UNO pipe, plus the Desktop bound to it."""
+
+    process: subprocess.Popen
+    profile_dir: str
+    desktop: Any = None
+    # UNO sessions are single-threaded; every call through the bridge holds this
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Set by the _uno_convert watchdog when it had to kill a stuck daemon
+    hung: bool = False
+
+
+# Per-thread conversion state: .daemon (start_uno_daemon) and .tmp_dir (create_thread_tmp_dir)
+_thread_local = threading.local()
+
+# Every daemon started by start_uno_daemon, for shutdown
+_uno_daemons: list[_UnoDaemon] = []
+_uno_daemons_lock = threading.Lock()
+
+# Every scratch dir created by create_thread_tmp_dir, for cleanup
+_thread_tmp_dirs: list[str] = []
+_thread_tmp_dirs_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
 def _find_libreoffice() -> str | None:
-    """Return path to soffice executable, or None if not found."""
+    """
+    Return path to soffice executable, or None if not found.
+    Cached for the life of the process (LIBREOFFICE_PATH is read on the first call).
+    """
     if sys.platform == "win32":
         names = ["soffice.exe", "soffice.com"]
         # Common install paths on Windows
@@ -44,6 +92,8 @@ def check_libreoffice_installed() -> tuple[bool, str]:
     """
     path = _find_libreoffice()
     if path is None:
+        # Don't remember the miss: the next check should see a fresh install
+        _find_libreoffice.cache_clear()
         return False, (
             "LibreOffice was not found. SlideToObsidian requires LibreOffice for PDF export.\n"
             "  - Install LibreOffice: https://www.libreoffice.org/download\n"
@@ -52,46 +102,352 @@ def check_libreoffice_installed() -> tuple[bool, str]:
     return True, path
 
 
+def _kill_soffice(proc: subprocess.Popen) -> None:
+    """Kill a soffice started with _NEW_PROCESS_GROUP, including its soffice.bin child."""
+    if sys.platform == "win32":
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        try:
+            # The session leader's pid is the process group id, even after the launcher exits
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    try:
+        proc.kill()
+    except OSError:
+        pass
+
+
+def _uno_property(name: str, value: Any) -> Any:
+    """Build a com.sun.star.beans.PropertyValue for UNO load/store arguments."""
+    from com.sun.star.beans import PropertyValue  # available once uno is imported
+
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+
+def start_uno_daemon(startup_timeout: float = 30.0) -> bool:
+    """
+    Launch a persistent soffice listening on a UNO pipe for the calling thread and connect
+    to it, so later conversions on this thread skip LibreOffice startup.
+    Requires LibreOffice's python `uno` module; returns False (and conversions keep using
+    the soffice CLI) when it or soffice is unavailable.
+    """
+    if getattr(_thread_local, "daemon", None) is not None:
+        return True
+    try:
+        import uno
+    except ImportError:
+        return False
+    soffice = _find_libreoffice()
+    if not soffice:
+        return False
+
+    # A named pipe unique to this daemon: nothing else can take it between launch and connect
+    pipe_name = f"slide2obs_{uuid.uuid4().hex}"
+    # Each daemon needs its own user profile; LibreOffice instances can't share one
+    profile_dir = tempfile.mkdtemp(prefix="slide2obs_profile_")
+    try:
+        proc = subprocess.Popen(
+            [
+                soffice,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--norestore",
+                f"-env:UserInstallation={Path(profile_dir).as_uri()}",
+                f"--accept=pipe,name={pipe_name};urp;",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            **_NEW_PROCESS_GROUP,
+        )
+    except OSError:
+        shutil.rmtree(profile_dir, ignore_errors=True)
+        return False
+    daemon = _UnoDaemon(process=proc, profile_dir=profile_dir)
+    with _uno_daemons_lock:
+        _uno_daemons.append(daemon)
+
+    try:
+        local_ctx = uno.getComponentContext()
+        resolver = local_ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_ctx
+        )
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            try:
+                ctx = resolver.resolve(f"uno:pipe,name={pipe_name};urp;StarOffice.ComponentContext")
+                break
+            except Exception:
+                if proc.poll() is not None or time.monotonic() > deadline:
+                    raise
+                time.sleep(0.25)
+        with daemon.lock:
+            daemon.desktop = ctx.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+    except Exception:
+        # Never leave a half-started daemon behind; the caller falls back to the CLI
+        _stop_daemon(daemon)
+        return False
+    _thread_local.daemon = daemon
+    return True
+
+
+def _stop_daemon(daemon: _UnoDaemon) -> None:
+    """Terminate one daemon and remove its profile. Safe to call repeatedly."""
+    with _uno_daemons_lock:
+        if daemon in _uno_daemons:
+            _uno_daemons.remove(daemon)
+    with daemon.lock:
+        desktop, daemon.desktop = daemon.desktop, None
+        if desktop is not None:
+            try:
+                desktop.terminate()
+            except Exception:
+                pass
+    if daemon.process.poll() is None:
+        daemon.process.terminate()
+        try:
+            daemon.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            pass
+    # The launcher exiting doesn't mean soffice.bin did; clear out the whole group
+    _kill_soffice(daemon.process)
+    try:
+        daemon.process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        pass
+    shutil.rmtree(daemon.profile_dir, ignore_errors=True)
+
+
+def stop_uno_daemons() -> None:
+    """Shut down every UNO daemon started by start_uno_daemon in this process."""
+    with _uno_daemons_lock:
+        daemons = list(_uno_daemons)
+    for daemon in daemons:
+        _stop_daemon(daemon)
+
+
+atexit.register(stop_uno_daemons)
+
+
+def _kill_hung_daemon(daemon: _UnoDaemon) -> None:
+    """Watchdog for _uno_convert: kill a daemon stuck on one file past _TIMEOUT_PER_FILE."""
+    daemon.hung = True
+    # Killing only the launcher would leave soffice.bin holding the bridge open
+    _kill_soffice(daemon.process)
+
+
+def _uno_convert(daemon: _UnoDaemon, pptx_path: Path, dest_pdf: Path) -> bool:
+    """
+    Convert one file through a UNO daemon (load + store as impress_pdf_Export).
+    The bridge calls have no timeout of their own, so a watchdog kills the daemon after
+    _TIMEOUT_PER_FILE; the daemon is then dead and later files fall back to the CLI.
+    """
+    import uno
+
+    with daemon.lock:
+        if daemon.desktop is None:
+            return False
+        watchdog = threading.Timer(_TIMEOUT_PER_FILE, _kill_hung_daemon, args=(daemon,))
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            doc = daemon.desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(str(pptx_path)), "_blank", 0,
+                (_uno_property("Hidden", True),),
+            )
+            if doc is None:
+                return False
+            try:
+                doc.storeToURL(
+                    uno.systemPathToFileUrl(str(dest_pdf)),
+                    (_uno_property("FilterName", "impress_pdf_Export"),),
+                )
+            finally:
+                doc.close(True)
+        except Exception:
+            return False
+        finally:
+            watchdog.cancel()
+            if daemon.hung:
+                daemon.desktop = None
+        if daemon.hung:
+            return False
+    return dest_pdf.is_file()
+
+
+def create_thread_tmp_dir(parent: str | Path | None = None) -> Path:
+    """
+    Create the calling thread's scratch dir for soffice output; every CLI conversion on this
+    thread reuses it instead of creating and removing a temp dir per batch.
+    With parent on the same filesystem as the outputs, PDFs are renamed into place rather
+    than copied; falls back to the system temp dir if parent isn't writable.
+    Removed by remove_thread_tmp_dirs (also registered with atexit).
+    """
+    tmp_dir = getattr(_thread_local, "tmp_dir", None)
+    if tmp_dir is not None:
+        return tmp_dir
+    try:
+        tmp_dir = Path(tempfile.mkdtemp(prefix=".slide2obs_", dir=parent))
+    except OSError:
+        tmp_dir = Path(tempfile.mkdtemp(prefix="slide2obs_"))
+    with _thread_tmp_dirs_lock:
+        _thread_tmp_dirs.append(str(tmp_dir))
+    _thread_local.tmp_dir = tmp_dir
+    return tmp_dir
+
+
+def remove_thread_tmp_dirs() -> None:
+    """Remove every scratch dir created by create_thread_tmp_dir in this process."""
+    with _thread_tmp_dirs_lock:
+        tmp_dirs = list(_thread_tmp_dirs)
+        _thread_tmp_dirs.clear()
+    for tmp_dir in tmp_dirs:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+atexit.register(remove_thread_tmp_dirs)
+
+
 def convert_pptx_to_pdf(pptx_path: str | Path, output_dir: str | Path) -> Path | None:
     """
     Convert a single PPTX file to PDF using LibreOffice headless.
     PDF is written to output_dir with the same stem as the PPTX.
     Returns path to the created PDF, or None on failure.
     """
-    pptx_path = Path(pptx_path).resolve()
+    return convert_pptx_batch_to_pdf([Path(pptx_path)], output_dir)[0]
+
+
+def convert_pptx_batch_to_pdf(pptx_paths: list[Path], output_dir: str | Path) -> list[Path | None]:
+    """
+    Convert several PPTX files to PDF with a single LibreOffice headless invocation,
+    so soffice startup is paid once per batch instead of once per file. When the calling
+    thread has a UNO daemon running (start_uno_daemon), files go through it instead.
+    PDFs are written to output_dir with the same stems as the inputs; input stems must be unique.
+    Returns one entry per input (in order): path to the created PDF, or None on failure.
+    """
+    pptx_paths = [Path(p).resolve() for p in pptx_paths]
     output_dir = Path(output_dir).resolve()
-    if not pptx_path.is_file():
-        return None
+    results: list[Path | None] = [None] * len(pptx_paths)
+    valid = [p for p in pptx_paths if p.is_file()]
+    if not valid:
+        return results
 
     soffice = _find_libreoffice()
     if not soffice:
-        return None
+        return results
 
     output_dir.mkdir(parents=True, exist_ok=True)
+    daemon = getattr(_thread_local, "daemon", None)
+    if daemon is not None:
+        # Daemon already running: no soffice startup at all. Anything it fails on
+        # falls through to the CLI batch below.
+        for i, pptx_path in enumerate(pptx_paths):
+            if pptx_path in valid:
+                dest_pdf = output_dir / (pptx_path.stem + ".pdf")
+                if _uno_convert(daemon, pptx_path, dest_pdf):
+                    results[i] = dest_pdf
+        valid = [p for p, r in zip(pptx_paths, results) if r is None and p in valid]
+        if not valid:
+            return results
+
     # LibreOffice writes to the same directory as the input by default; use a temp dir
     # and then move the PDF to preserve input dir structure
+    tmp_dir = getattr(_thread_local, "tmp_dir", None)
+    if tmp_dir is not None and tmp_dir.is_dir():
+        # Pipeline thread: other threads run soffice concurrently, so use this thread's
+        # own user profile (LibreOffice instances can't share one)
+        _soffice_batch(
+            soffice, valid, pptx_paths, output_dir, tmp_dir, results,
+            profile_dir=tmp_dir / "profile",
+        )
+        return results
     with tempfile.TemporaryDirectory(prefix="slide2obs_") as tmp:
-        tmp_path = Path(tmp)
-        try:
-            subprocess.run(
-                [
-                    soffice,
-                    "--headless",
-                    "--convert-to", "pdf",
-                    "--outdir", str(tmp_path),
-                    str(pptx_path),
-                ],
-                capture_output=True,
-                timeout=120,
-                check=True,
-            )
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            return None
+        _soffice_batch(soffice, valid, pptx_paths, output_dir, Path(tmp), results)
+    return results
+
 
+def _soffice_batch(
+    soffice: str,
+    inputs: list[Path],
+    pptx_paths: list[Path],
+    output_dir: Path,
+    tmp_path: Path,
+    results: list[Path | None],
+    profile_dir: Path | None = None,
+) -> None:
+    """
+    Run one soffice --convert-to pdf over inputs into tmp_path, then move each produced PDF
+    to output_dir (rename when possible, else copy), filling the still-empty slots of results
+    (aligned with pptx_paths). If the batch times out, the unfinished files are retried singly.
+    profile_dir, when given, is used as the LibreOffice user profile instead of the default one.
+    """
+    # tmp_path may be reused across batches; don't pick up a PDF left by an earlier one
+    for pptx_path in inputs:
+        (tmp_path / (pptx_path.stem + ".pdf")).unlink(missing_ok=True)
+    profile_args = [f"-env:UserInstallation={profile_dir.as_uri()}"] if profile_dir else []
+    timed_out = False
+    try:
+        proc = subprocess.Popen(
+            [
+                soffice,
+                *profile_args,
+                "--headless",
+                "--convert-to", "pdf",
+                "--outdir", str(tmp_path),
+                *(str(p) for p in inputs),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            **_NEW_PROCESS_GROUP,
+        )
+    except OSError:
+        return
+    try:
+        # A non-zero exit can still leave some files converted; collect whatever exists
+        proc.wait(timeout=_TIMEOUT_PER_FILE * len(inputs))
+    except subprocess.TimeoutExpired:
+        # soffice handles inputs in order and was killed mid-batch: earlier files are done.
+        # Kill the whole group: an orphaned soffice.bin would keep holding the profile.
+        _kill_soffice(proc)
+        proc.wait()
+        timed_out = True
+        if profile_dir is not None:
+            # The kill can leave the profile locked or half-written; retries start a fresh one
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+    produced = [p for p in inputs if (tmp_path / (p.stem + ".pdf")).is_file()]
+    if timed_out and produced:
+        # The last PDF written may have been cut off by the kill; redo that file too
+        (tmp_path / (produced[-1].stem + ".pdf")).unlink(missing_ok=True)
+        produced.pop()
+
+    for i, pptx_path in enumerate(pptx_paths):
+        if results[i] is not None or pptx_path not in produced:
+            continue
         pdf_name = pptx_path.stem + ".pdf"
         src_pdf = tmp_path / pdf_name
-        if not src_pdf.is_file():
-            return None
         dest_pdf = output_dir / pdf_name
-        shutil.copy2(src_pdf, dest_pdf)
-        return dest_pdf
+        try:
+            # Same filesystem: a metadata-only rename, no content copy
+            os.replace(src_pdf, dest_pdf)
+        except OSError:
+            shutil.copy2(src_pdf, dest_pdf)
+            src_pdf.unlink()
+        results[i] = dest_pdf
+
+    if timed_out and len(inputs) > 1:
+        # Retry what's left one file at a time, so a deck that hangs soffice only fails itself
+        for pptx_path in inputs:
+            if pptx_path not in produced:
+                _soffice_batch(
+                    soffice, [pptx_path], pptx_paths, output_dir, tmp_path, results,
+                    profile_dir=profile_dir,
+                )
@@ -2,6 +2,17 @@
 
 import re
 
+import yaml
+
+try:
+    from yaml import CSafeDumper as _YamlDumper  # libyaml C emitter
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+# Markdown header boundaries used to split markitdown output into slides
+_HEADER_SPLIT = re.compile(r"\n(?=#{1,6}\s)")
+_HEADER_HEAD = re.compile(r"#{1,6}\s")
+
 
 def split_markdown_by_slides(full_md: str, slide_count: int) -> list[str]:
     """
@@ -17,9 +28,9 @@ def split_markdown_by_slides(full_md: str, slide_count: int) -> list[str]:
         return [""] * slide_count
 
     # Split by lines that start with ## or # (at start or after newline)
-    parts = re.split(r"\n(?=#{1,6}\s)", stripped)
+    parts = _HEADER_SPLIT.split(stripped)
     # If first line isn't a header, the first "part" is the intro; keep it
-    if parts and not re.match(r"^#{1,6}\s", parts[0].strip()):
+    if parts and not _HEADER_HEAD.match(parts[0].lstrip()):
         # First part is body before first header
         if len(parts) <= slide_count:
             # One slide gets intro + first header content; rest get subsequent
@@ -64,8 +75,8 @@ def build_markdown(
     pdf_ref = f"{pdf_basename}.pdf"
     lines: list[str] = []
 
-    # Frontmatter: speaker notes as list
-    notes_for_yaml = [n for n in speaker_notes if n]
+    # Frontmatter: speaker notes as list (one line each, as Obsidian shows them)
+    notes_for_yaml = [n.replace("\n", " ") for n in speaker_notes if n]
     frontmatter: dict[str, list[str] | str] = {}
     if title:
         frontmatter["title"] = title
@@ -73,18 +84,16 @@ def build_markdown(
         frontmatter["speaker_notes"] = notes_for_yaml
     if frontmatter:
         lines.append("---")
-        for k, v in frontmatter.items():
-            if k == "speaker_notes" and isinstance(v, list):
-                lines.append("speaker_notes:")
-                for n in v:
-                    # Escape for YAML: backslash and quotes
-                    n_esc = n.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
-                    lines.append(f'  - "{n_esc}"')
-            elif isinstance(v, str):
-                v_esc = v.replace("\\", "\\\\").replace('"', '\\"')
-                lines.append(f'{k}: "{v_esc}"')
-            else:
-                lines.append(f"{k}: {v}")
+        lines.append(
+            yaml.dump(
+                frontmatter,
+                Dumper=_YamlDumper,
+                default_flow_style=False,
+                allow_unicode=True,
+                sort_keys=False,
+                width=10**9,
+            ).rstrip("\n")
+        )
         lines.append("---")
         lines.append("")
 
@@ -92,12 +101,12 @@ def build_markdown(
     sections = body_sections if len(body_sections) >= slide_count else body_sections + [""] * (slide_count - len(body_sections))
     sections = sections[: slide_count]
 
+    # Format the embed once; "%" in the file name must survive %-formatting
+    embed_fmt = f"![[{pdf_ref.replace('%', '%%')}#page=%d]]"
     for n, section_text in enumerate(sections, start=1):
-        lines.append(f"![[{pdf_ref}#page={n}]]")
-        lines.append("")
         if section_text:
-            lines.append(section_text.strip())
-            lines.append("")
-        lines.append("")
+            lines.extend((embed_fmt % n, "", section_text.strip(), "", ""))
+        else:
+            lines.extend((embed_fmt % n, "", ""))
 
     return "\n".join(lines).strip() + "\n"
@@ -21,6 +21,7 @@ def set_pdf_metadata(
     if not path.is_file():
         return
     tmp_path: str | None = None
+    doc = None
     try:
         doc = fitz.open(path)
         meta = dict(doc.metadata) if doc.metadata else {}
@@ -29,6 +30,11 @@ def set_pdf_metadata(
         if source is not None:
             meta["producer"] = f"SlideToObsidian; source={source}"
         doc.set_metadata(meta)
+        if doc.can_save_incrementally():
+            # Appends only the updated info dict + xref instead of rewriting the file
+            doc.save(str(path), incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+            return
+        # Files pymupdf had to repair on open can't be updated in place; rewrite fully
         fd, tmp_path = tempfile.mkstemp(suffix=".pdf")
         os.close(fd)
         doc.save(tmp_path)
@@ -39,6 +45,11 @@ def set_pdf_metadata(
     except Exception:
         pass
     finally:
+        if doc is not None:
+            try:
+                doc.close()
+            except Exception:
+                pass
         if tmp_path and Path(tmp_path).exists():
             try:
                 Path(tmp_path).unlink()
@@ -1,11 +1,38 @@
-"""Extract speaker notes, slide count, and alt-text from PPTX using python-pptx."""
+"""
+Extract speaker notes, slide count, and alt-text from PPTX.
+Slide count and notes are read straight from the package XML with lxml; python-pptx is the
+fallback for those and is used for alt-text.
+"""
 
+import io
+import posixpath
+import zipfile
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
+from lxml import etree
 from pptx import Presentation
 from pptx.slide import Slide
 
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_SLD_ID = f"{{{_P_NS}}}sldId"
+_SP = f"{{{_P_NS}}}sp"
+_PH_PATH = f"{{{_P_NS}}}nvSpPr/{{{_P_NS}}}nvPr/{{{_P_NS}}}ph"
+_A_P = f"{{{_A_NS}}}p"
+_A_T = f"{{{_A_NS}}}t"
+_A_BR = f"{{{_A_NS}}}br"
+_R_ID = f"{{{_R_NS}}}id"
+_REL = f"{{{_PKG_REL_NS}}}Relationship"
+
+_PRESENTATION_PART = "ppt/presentation.xml"
+
+# Errors meaning "not a readable OOXML package"; callers fall back to python-pptx
+_PACKAGE_ERRORS = (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError)
+
 
 def _notes_text(slide: Slide) -> str:
     """Get speaker notes text for one slide; empty string if none."""
@@ -19,31 +46,105 @@ def _notes_text(slide: Slide) -> str:
         return ""
 
 
+def _read_rels(zf: zipfile.ZipFile, part: str) -> dict[str, tuple[str, str]]:
+    """Map rId -> (relationship type, target part name) for one part; {} if it has no rels."""
+    part_dir, part_name = posixpath.split(part)
+    try:
+        root = etree.fromstring(zf.read(f"{part_dir}/_rels/{part_name}.rels"))
+    except KeyError:
+        return {}
+    rels: dict[str, tuple[str, str]] = {}
+    for rel in root.iter(_REL):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(part_dir, target))
+        rels[rel.get("Id", "")] = (rel.get("Type", ""), target)
+    return rels
+
+
+def _notes_part_text(data: bytes) -> str:
+    """Text of the body placeholder of a notesSlide part (what python-pptx calls notes_text_frame)."""
+    for _, sp in etree.iterparse(io.BytesIO(data), events=("end",), tag=_SP):
+        ph = sp.find(_PH_PATH)
+        if ph is None or ph.get("type") != "body":
+            continue
+        paragraphs: list[str] = []
+        for para in sp.iter(_A_P):
+            paragraphs.append("".join(
+                (el.text or "") if el.tag == _A_T else "\n"
+                for el in para.iter(_A_T, _A_BR)
+            ))
+        return "\n".join(paragraphs).strip()
+    return ""
+
+
+def _slide_notes_xml(zf: zipfile.ZipFile, slide_part: str) -> str:
+    """Speaker notes for one slide part; empty string if it has no notes slide."""
+    for rel_type, target in _read_rels(zf, slide_part).values():
+        if rel_type.endswith("/notesSlide"):
+            return _notes_part_text(zf.read(target))
+    return ""
+
+
+def _read_pptx_xml(source: Path | IO[bytes]) -> tuple[int, list[str]]:
+    """
+    (slide_count, speaker_notes) straight from the package XML: slide order from
+    presentation.xml, slide -> notesSlide mapping from each slide's rels.
+    """
+    with zipfile.ZipFile(source) as zf:
+        pres = etree.fromstring(zf.read(_PRESENTATION_PART))
+        slide_rids = [sld_id.get(_R_ID) for sld_id in pres.iter(_SLD_ID)]
+        pres_rels = _read_rels(zf, _PRESENTATION_PART)
+        notes: list[str] = []
+        for rid in slide_rids:
+            try:
+                notes.append(_slide_notes_xml(zf, pres_rels[rid][1]))
+            except Exception:
+                notes.append("")
+    return len(slide_rids), notes
+
+
 def get_speaker_notes(pptx_path: str | Path) -> list[str]:
     """
     Return a list of speaker note strings, one per slide, in order.
     Empty string for slides with no notes.
     """
-    path = Path(pptx_path)
-    if not path.is_file():
-        return []
-    try:
-        prs = Presentation(str(path))
-        return [_notes_text(s) for s in prs.slides]
-    except Exception:
-        return []
+    return load_pptx_info(pptx_path)[1]
 
 
 def get_slide_count(pptx_path: str | Path) -> int:
     """Return the number of slides in the presentation."""
-    path = Path(pptx_path)
-    if not path.is_file():
-        return 0
+    return load_pptx_info(pptx_path)[0]
+
+
+def load_pptx_info(pptx: str | Path | bytes) -> tuple[int, list[str]]:
+    """
+    Return (slide_count, speaker_notes) from one pass over the package XML.
+    pptx is a path or the file's contents (when the caller has already read it).
+    speaker_notes has one string per slide ("" when a slide has none).
+    Returns (0, []) if the file is missing or can't be read.
+    """
+    if isinstance(pptx, bytes):
+        source: Path | IO[bytes] = io.BytesIO(pptx)
+    else:
+        source = Path(pptx)
+        if not source.is_file():
+            return 0, []
     try:
-        prs = Presentation(str(path))
-        return len(prs.slides)
+        return _read_pptx_xml(source)
+    except _PACKAGE_ERRORS:
+        pass
+    # Not a readable OOXML package; let python-pptx have the final say
+    try:
+        prs = Presentation(io.BytesIO(pptx) if isinstance(pptx, bytes) else str(source))
+        notes = [_notes_text(s) for s in prs.slides]
+        return len(notes), notes
     except Exception:
-        return 0
+        return 0, []
 
 
 def get_slide_text_and_alt(pptx_path: str | Path) -> list[dict[str, Any]]:
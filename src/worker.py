@@ -1,16 +1,31 @@
 """
-Worker for ProcessPoolExecutor: one MarkItDown per process, reused for all tasks.
-Each task converts one PPTX; exceptions are caught so one bad file doesn't kill the batch.
+Workers for the two-stage pipeline.
+PDF stage: threads (LibreOffice runs as a subprocess, so waiting on it releases the GIL);
+each thread may own a persistent UNO daemon.
+MD stage: ProcessPoolExecutor workers, one MarkItDown per process, reused for all tasks.
+Exceptions are caught so one bad file doesn't kill the batch.
 """
 
+import threading
 from pathlib import Path
 from typing import Any
 
 from markitdown import MarkItDown
 
+from .libreoffice import (
+    convert_pptx_batch_to_pdf,
+    create_thread_tmp_dir,
+    remove_thread_tmp_dirs,
+    start_uno_daemon,
+    stop_uno_daemons,
+)
+
 # Module-level MarkItDown created in worker init; reused for all tasks in this process
 _worker_markitdown: MarkItDown | None = None
 
+# Per PDF thread: .batches converted so far and .daemon_slots (see _init_pdf_thread)
+_pdf_thread = threading.local()
+
 
 def _init_worker() -> None:
     """Called once per worker process; create a single MarkItDown instance."""
@@ -18,21 +33,65 @@ def _init_worker() -> None:
     _worker_markitdown = MarkItDown()
 
 
-def convert_one_worker(
+def _init_pdf_thread(
+    output_base: str | None = None,
+    daemon_slots: threading.Semaphore | None = None,
+) -> None:
+    """
+    Called once per PDF thread; create the thread's reusable soffice scratch dir (under
+    output_base, so PDFs can be renamed into place). UNO daemons are started lazily by
+    convert_pdf_batch, at most one per daemon_slots permit.
+    """
+    create_thread_tmp_dir(output_base)
+    _pdf_thread.daemon_slots = daemon_slots
+    _pdf_thread.batches = 0
+
+
+def _cleanup_pdf_threads() -> None:
+    """Called once the PDF thread pool is done: stop daemons and remove scratch dirs."""
+    stop_uno_daemons()
+    remove_thread_tmp_dirs()
+
+
+def convert_pdf_batch(
+    pptx_paths: list[str],
+    output_dir: str,
+) -> list[str | None]:
+    """
+    PDF stage: convert a batch of PPTX files sharing one output dir with one LibreOffice run.
+    Returns one PDF path (or None on failure) per input; never raises.
+    """
+    try:
+        _pdf_thread.batches = getattr(_pdf_thread, "batches", 0) + 1
+        slots = getattr(_pdf_thread, "daemon_slots", None)
+        # A daemon only pays for its startup once a thread has more than one batch;
+        # when the LibreOffice `uno` module is importable, take a permit and start one
+        if _pdf_thread.batches == 2 and slots is not None and slots.acquire(blocking=False):
+            if not start_uno_daemon():
+                slots.release()
+        pdf_paths = convert_pptx_batch_to_pdf([Path(p) for p in pptx_paths], output_dir)
+        return [str(p) if p is not None else None for p in pdf_paths]
+    except Exception:
+        return [None] * len(pptx_paths)
+
+
+def finish_one_worker(
     pptx_path: str,
+    pdf_path: str | None,
     output_dir: str,
 ) -> dict[str, Any]:
     """
-    Convert a single PPTX to PDF + MD. Uses the process-local MarkItDown.
-    Always returns a result dict; never raises (one corrupt file doesn't crash the batch).
+    MD stage: post-process one file whose PDF stage is done. Uses the process-local MarkItDown.
+    Always returns a result dict; never raises.
     """
     try:
-        from .converter import convert_one
-        md = _worker_markitdown if _worker_markitdown is not None else None
-        return convert_one(
-            Path(pptx_path),
-            Path(output_dir),
-            markitdown_instance=md,
+        from .converter import finish_one
+        md = _worker_markitdown if _worker_markitdown is not None else MarkItDown()
+        return finish_one(
+            Path(pptx_path).resolve(),
+            Path(pdf_path) if pdf_path is not None else None,
+            Path(output_dir).resolve(),
+            md,
         )
     except Exception as e:
         return {